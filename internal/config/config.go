@@ -39,16 +39,9 @@ type ToolsConfig struct {
 
 // LoadConfig loads configuration from the specified file path
 func LoadConfig(configPath string) (*Config, error) {
-	// Try to load .env file from multiple locations
-	envPaths := []string{".env", "./.env", filepath.Join(".", ".env")}
-	envLoaded := false
-
-	for _, envPath := range envPaths {
-		if err := godotenv.Load(envPath); err == nil {
-			envLoaded = true
-			break
-		}
-	}
+	// Load .env from the current directory; ".env", "./.env" and
+	// filepath.Join(".", ".env") all name the same file, so one attempt is enough
+	envLoaded := godotenv.Load(".env") == nil
 
 	// Also try to load from home directory
 	if !envLoaded {
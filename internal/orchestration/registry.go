@@ -40,9 +40,10 @@ func build(cfg *config.Config) error {
 	if pCfg, ok := cfg.Providers["openai"]; ok {
 		if pCfg.Key != "" && pCfg.Key != "${OPENAI_API_KEY}" {
 			temperature := cfg.GetEffectiveTemperature("openai")
+			// Every model shares one API client
+			base := openai.New(pCfg.Key, nil, temperature, cfg.System)
 			for _, m := range pCfg.Models {
-				client := openai.New(pCfg.Key, []string{m}, temperature, cfg.System)
-				modelToProvider[m] = client
+				modelToProvider[m] = base.WithModel(m)
 			}
 		} else {
 			initErrors = append(initErrors, "OpenAI: API key not set (OPENAI_API_KEY environment variable)")
@@ -53,9 +54,10 @@ func build(cfg *config.Config) error {
 	if pCfg, ok := cfg.Providers["anthropic"]; ok {
 		if pCfg.Key != "" && pCfg.Key != "${ANTHROPIC_API_KEY}" {
 			temperature := cfg.GetEffectiveTemperature("anthropic")
+			// Every model shares one API client
+			base := anthropic.New(pCfg.Key, nil, temperature, cfg.System)
 			for _, m := range pCfg.Models {
-				client := anthropic.New(pCfg.Key, []string{m}, temperature, cfg.System)
-				modelToProvider[m] = client
+				modelToProvider[m] = base.WithModel(m)
 			}
 		} else {
 			initErrors = append(initErrors, "Anthropic: API key not set (ANTHROPIC_API_KEY environment variable)")
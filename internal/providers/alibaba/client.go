@@ -58,7 +58,7 @@ func (c *AlibabaClient) Chat(ctx context.Context, messages []providers.ChatMessa
 	}
 	
 	// Convert messages to OpenAI format (since we're using OpenAI-compatible API)
-	openaiMessages := make([]openai.ChatCompletionMessage, 0)
+	openaiMessages := make([]openai.ChatCompletionMessage, 1, len(messages)+1)
 	
 	// Add system prompt if configured
 	systemPrompt := c.systemPrompt
@@ -87,14 +87,7 @@ func (c *AlibabaClient) Chat(ctx context.Context, messages []providers.ChatMessa
 		}
 	}
 	
-	// Add system message at the beginning if we have one
-	if systemPrompt != "" {
-		systemMsg := openai.ChatCompletionMessage{
-			Role:    "system",
-			Content: systemPrompt,
-		}
-		openaiMessages = append([]openai.ChatCompletionMessage{systemMsg}, openaiMessages...)
-	}
+	openaiMessages = withSystemMessage(openaiMessages, systemPrompt)
 
 	// Convert tools to OpenAI format
 	var openaiTools []openai.Tool
@@ -161,7 +154,7 @@ func (c *AlibabaClient) Chat(ctx context.Context, messages []providers.ChatMessa
 // StreamChat sends a message to Alibaba Qwen and returns a streaming response
 func (c *AlibabaClient) StreamChat(ctx context.Context, model string, messages []providers.ChatMessage, temperature float64) (<-chan string, error) {
 	// Convert messages to OpenAI format
-	openaiMessages := make([]openai.ChatCompletionMessage, 0)
+	openaiMessages := make([]openai.ChatCompletionMessage, 1, len(messages)+1)
 	systemPrompt := c.systemPrompt
 	
 	for _, msg := range messages {
@@ -184,14 +177,7 @@ func (c *AlibabaClient) StreamChat(ctx context.Context, model string, messages [
 		}
 	}
 	
-	// Add system message at the beginning if we have one
-	if systemPrompt != "" {
-		systemMsg := openai.ChatCompletionMessage{
-			Role:    "system",
-			Content: systemPrompt,
-		}
-		openaiMessages = append([]openai.ChatCompletionMessage{systemMsg}, openaiMessages...)
-	}
+	openaiMessages = withSystemMessage(openaiMessages, systemPrompt)
 
 	// Create streaming chat completion request
 	req := openai.ChatCompletionRequest{
@@ -251,4 +237,18 @@ func (c *AlibabaClient) SendToolResult(ctx context.Context, messages []providers
 
 	// Continue conversation without re-sending tool definitions (nil tools).
 	return c.Chat(ctx, augmented, nil)
-}
\ No newline at end of file
+}
+
+// withSystemMessage fills slot 0, which the message conversions reserve so
+// the system message never has to be prepended, or drops it if there is no
+// system prompt
+func withSystemMessage(msgs []openai.ChatCompletionMessage, systemPrompt string) []openai.ChatCompletionMessage {
+	if systemPrompt == "" {
+		return msgs[1:]
+	}
+	msgs[0] = openai.ChatCompletionMessage{
+		Role:    "system",
+		Content: systemPrompt,
+	}
+	return msgs
+}
@@ -16,7 +16,11 @@ var anthropicDebug = os.Getenv("MAGIKARP_DEBUG") == "1"
 var debugFile *os.File
 
 func init() {
-	// Always try to create debug file to test if this init runs
+	// Only open the debug file when debugging is enabled
+	if !anthropicDebug {
+		return
+	}
+
 	var err error
 	debugFile, err = os.OpenFile("magikarp_debug.log", os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0644)
 	if err != nil {
@@ -27,7 +31,7 @@ func init() {
 
 	// Write a startup message
 	timestamp := time.Now().Format("2006/01/02 15:04:05")
-	fmt.Fprintf(debugFile, "%s [Anthropic] Init: MAGIKARP_DEBUG=%s, debug enabled=%t\n", timestamp, os.Getenv("MAGIKARP_DEBUG"), anthropicDebug)
+	fmt.Fprintf(debugFile, "%s [Anthropic] Init: debug enabled\n", timestamp)
 	debugFile.Sync()
 }
 
@@ -35,7 +39,6 @@ func debugLog(format string, args ...interface{}) {
 	if anthropicDebug && debugFile != nil {
 		timestamp := time.Now().Format("2006/01/02 15:04:05")
 		fmt.Fprintf(debugFile, "%s [Anthropic] "+format+"\n", append([]interface{}{timestamp}, args...)...)
-		debugFile.Sync() // Flush immediately so we can tail -f
 	}
 }
 
@@ -70,6 +73,14 @@ func NewAnthropicClient(model string, configPath string) (*AnthropicClient, erro
 	return New(os.Getenv("ANTHROPIC_API_KEY"), []string{model}, 0.0, ""), nil
 }
 
+// WithModel returns a copy of the provider bound to model that shares the
+// underlying Anthropic client
+func (c *AnthropicClient) WithModel(model string) *AnthropicClient {
+	clone := *c
+	clone.models = []string{model}
+	return &clone
+}
+
 // Name returns the name of the provider
 func (c *AnthropicClient) Name() string {
 	return "anthropic"
@@ -127,19 +138,13 @@ func (c *AnthropicClient) Chat(ctx context.Context, messages []providers.ChatMes
 	}
 	model := c.models[0]
 
-	// Prepare system prompt parameter
-	var systemBlocks []anthropic.TextBlockParam
-	if systemPrompt != "" {
-		systemBlocks = []anthropic.TextBlockParam{{Type: "text", Text: systemPrompt}}
-	}
-
 	// Send request to Anthropic
 	message, err := c.client.Messages.New(ctx, anthropic.MessageNewParams{
 		Model:       anthropic.Model(model),
 		MaxTokens:   1024,
 		Messages:    anthropicMessages,
 		Tools:       anthropicTools,
-		System:      systemBlocks,
+		System:      systemBlocks(systemPrompt),
 		Temperature: anthropic.Float(c.temperature),
 	})
 	if err != nil {
@@ -197,7 +202,7 @@ func (c *AnthropicClient) StreamChat(ctx context.Context, model string, messages
 		Model:       anthropic.Model(model),
 		MaxTokens:   1024,
 		Messages:    anthropicMessages,
-		System:      []anthropic.TextBlockParam{{Type: "text", Text: systemPrompt}},
+		System:      systemBlocks(systemPrompt),
 		Temperature: anthropic.Float(temperature),
 	})
 
@@ -250,6 +255,20 @@ func (c *AnthropicClient) SendToolResult(ctx context.Context, messages []provide
 	return c.Chat(ctx, augmented, nil)
 }
 
+// systemBlocks returns the system prompt as a single text block marked for
+// prompt caching, so the unchanged prefix is reused across turns instead of
+// being reprocessed. An empty prompt yields no blocks.
+func systemBlocks(systemPrompt string) []anthropic.TextBlockParam {
+	if systemPrompt == "" {
+		return nil
+	}
+	return []anthropic.TextBlockParam{{
+		Type:         "text",
+		Text:         systemPrompt,
+		CacheControl: anthropic.NewCacheControlEphemeralParam(),
+	}}
+}
+
 func toStringSlice(v any) []string {
 	if v == nil {
 		return nil
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"os"
+	"strings"
 
 	"github.com/google/generative-ai-go/genai"
 	"github.com/pprunty/magikarp/internal/providers"
@@ -113,32 +114,34 @@ func (c *GeminiClient) Chat(ctx context.Context, messages []providers.ChatMessag
 	var toolUses []providers.ToolUse
 
 	for _, candidate := range resp.Candidates {
-		if candidate.Content != nil {
-			for _, part := range candidate.Content.Parts {
-				if text, ok := part.(genai.Text); ok {
-					resultMessages = append(resultMessages, providers.ChatMessage{
-						Role:    providers.RoleAssistant,
-						Content: string(text),
-					})
-				}
-			}
+		if candidate.Content == nil {
+			continue
 		}
-
-		// Handle function calls (Gemini uses a custom JSON format)
-		if candidate.Content != nil {
-			for _, part := range candidate.Content.Parts {
-				if text, ok := part.(genai.Text); ok {
-					var functionCall struct {
-						Name      string          `json:"name"`
-						Arguments json.RawMessage `json:"arguments"`
-					}
-					if err := json.Unmarshal([]byte(text), &functionCall); err == nil && functionCall.Name != "" {
-						toolUses = append(toolUses, providers.ToolUse{
-							Name:  functionCall.Name,
-							Input: functionCall.Arguments,
-						})
-					}
-				}
+		for _, part := range candidate.Content.Parts {
+			text, ok := part.(genai.Text)
+			if !ok {
+				continue
+			}
+			resultMessages = append(resultMessages, providers.ChatMessage{
+				Role:    providers.RoleAssistant,
+				Content: string(text),
+			})
+
+			// Handle function calls (Gemini uses a custom JSON format). Only
+			// text that is a JSON object can be one, so skip decoding prose.
+			trimmed := strings.TrimSpace(string(text))
+			if !strings.HasPrefix(trimmed, "{") {
+				continue
+			}
+			var functionCall struct {
+				Name      string          `json:"name"`
+				Arguments json.RawMessage `json:"arguments"`
+			}
+			if err := json.Unmarshal([]byte(trimmed), &functionCall); err == nil && functionCall.Name != "" {
+				toolUses = append(toolUses, providers.ToolUse{
+					Name:  functionCall.Name,
+					Input: functionCall.Arguments,
+				})
 			}
 		}
 	}
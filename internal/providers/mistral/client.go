@@ -56,10 +56,12 @@ func (c *MistralClient) Chat(ctx context.Context, messages []providers.ChatMessa
 	}
 
 	// Convert messages to Mistral format
-	mistralMessages := make([]mistral.ChatMessage, 0)
+	mistralMessages := make([]mistral.ChatMessage, 1, len(messages)+1)
+	hasSystemMessage := false
 	
 	for _, msg := range messages {
 		if msg.Role == providers.RoleSystem {
+			hasSystemMessage = true
 			mistralMessages = append(mistralMessages, mistral.ChatMessage{
 				Role:    mistral.RoleSystem,
 				Content: msg.Content,
@@ -83,22 +85,7 @@ func (c *MistralClient) Chat(ctx context.Context, messages []providers.ChatMessa
 	}
 
 	// Add system message at the beginning if we have one from config and no system message in conversation
-	if c.systemPrompt != "" {
-		hasSystemMessage := false
-		for _, msg := range messages {
-			if msg.Role == providers.RoleSystem {
-				hasSystemMessage = true
-				break
-			}
-		}
-		if !hasSystemMessage {
-			systemMsg := mistral.ChatMessage{
-				Role:    mistral.RoleSystem,
-				Content: c.systemPrompt,
-			}
-			mistralMessages = append([]mistral.ChatMessage{systemMsg}, mistralMessages...)
-		}
-	}
+	mistralMessages = c.withSystemPrompt(mistralMessages, hasSystemMessage)
 
 	// Send request to Mistral using the API
 	chatRes, err := c.client.Chat(modelName, mistralMessages, nil)
@@ -128,10 +115,12 @@ func (c *MistralClient) Chat(ctx context.Context, messages []providers.ChatMessa
 // StreamChat sends a message to Mistral and returns a streaming response
 func (c *MistralClient) StreamChat(ctx context.Context, model string, messages []providers.ChatMessage, temperature float64) (<-chan string, error) {
 	// Convert messages to Mistral format
-	mistralMessages := make([]mistral.ChatMessage, 0)
+	mistralMessages := make([]mistral.ChatMessage, 1, len(messages)+1)
+	hasSystemMessage := false
 	
 	for _, msg := range messages {
 		if msg.Role == providers.RoleSystem {
+			hasSystemMessage = true
 			mistralMessages = append(mistralMessages, mistral.ChatMessage{
 				Role:    mistral.RoleSystem,
 				Content: msg.Content,
@@ -150,22 +139,7 @@ func (c *MistralClient) StreamChat(ctx context.Context, model string, messages [
 	}
 	
 	// Add system message at the beginning if we have one from config and no system message in conversation
-	if c.systemPrompt != "" {
-		hasSystemMessage := false
-		for _, msg := range messages {
-			if msg.Role == providers.RoleSystem {
-				hasSystemMessage = true
-				break
-			}
-		}
-		if !hasSystemMessage {
-			systemMsg := mistral.ChatMessage{
-				Role:    mistral.RoleSystem,
-				Content: c.systemPrompt,
-			}
-			mistralMessages = append([]mistral.ChatMessage{systemMsg}, mistralMessages...)
-		}
-	}
+	mistralMessages = c.withSystemPrompt(mistralMessages, hasSystemMessage)
 
 	// Create streaming channel
 	responseChan := make(chan string, 100)
@@ -212,4 +186,18 @@ func (c *MistralClient) SendToolResult(ctx context.Context, messages []providers
 
 	// Continue the conversation with all tools available
 	return c.Chat(ctx, augmented, nil)
-}
\ No newline at end of file
+}
+
+// withSystemPrompt fills slot 0, which the message conversions reserve so the
+// configured system prompt never has to be prepended, or drops it if there is
+// no prompt or the conversation has its own system message
+func (c *MistralClient) withSystemPrompt(msgs []mistral.ChatMessage, hasSystemMessage bool) []mistral.ChatMessage {
+	if c.systemPrompt == "" || hasSystemMessage {
+		return msgs[1:]
+	}
+	msgs[0] = mistral.ChatMessage{
+		Role:    mistral.RoleSystem,
+		Content: c.systemPrompt,
+	}
+	return msgs
+}
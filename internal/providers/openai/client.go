@@ -18,7 +18,11 @@ var openaiDebug = os.Getenv("MAGIKARP_DEBUG") == "1"
 var debugFile *os.File
 
 func init() {
-	// Always try to create debug file to test if this init runs
+	// Only open the debug file when debugging is enabled
+	if !openaiDebug {
+		return
+	}
+
 	var err error
 	debugFile, err = os.OpenFile("magikarp_debug.log", os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0644)
 	if err != nil {
@@ -29,7 +33,7 @@ func init() {
 
 	// Write a startup message
 	timestamp := time.Now().Format("2006/01/02 15:04:05")
-	fmt.Fprintf(debugFile, "%s [OpenAI] Init: MAGIKARP_DEBUG=%s, debug enabled=%t\n", timestamp, os.Getenv("MAGIKARP_DEBUG"), openaiDebug)
+	fmt.Fprintf(debugFile, "%s [OpenAI] Init: debug enabled\n", timestamp)
 	debugFile.Sync()
 }
 
@@ -37,7 +41,6 @@ func debugLog(format string, args ...interface{}) {
 	if openaiDebug && debugFile != nil {
 		timestamp := time.Now().Format("2006/01/02 15:04:05")
 		fmt.Fprintf(debugFile, "%s [OpenAI] "+format+"\n", append([]interface{}{timestamp}, args...)...)
-		debugFile.Sync() // Flush immediately so we can tail -f
 	}
 }
 
@@ -72,6 +75,14 @@ func NewOpenAIClient(model string, configPath string) (*OpenAIClient, error) {
 	return New(os.Getenv("OPENAI_API_KEY"), []string{model}, 0.0, ""), nil
 }
 
+// WithModel returns a copy of the provider bound to model that shares the
+// underlying OpenAI client
+func (c *OpenAIClient) WithModel(model string) *OpenAIClient {
+	clone := *c
+	clone.models = []string{model}
+	return &clone
+}
+
 // Name returns the name of the provider
 func (c *OpenAIClient) Name() string {
 	return "openai"
@@ -86,7 +97,7 @@ func (c *OpenAIClient) Chat(ctx context.Context, messages []providers.ChatMessag
 	}
 	
 	// Convert messages to OpenAI format
-	openaiMessages := make([]openai.ChatCompletionMessage, 0)
+	openaiMessages := make([]openai.ChatCompletionMessage, 1, len(messages)+1)
 	
 	// Add system prompt if configured
 	systemPrompt := c.systemPrompt
@@ -115,14 +126,7 @@ func (c *OpenAIClient) Chat(ctx context.Context, messages []providers.ChatMessag
 		}
 	}
 	
-	// Add system message at the beginning if we have one
-	if systemPrompt != "" {
-		systemMsg := openai.ChatCompletionMessage{
-			Role:    "system",
-			Content: systemPrompt,
-		}
-		openaiMessages = append([]openai.ChatCompletionMessage{systemMsg}, openaiMessages...)
-	}
+	openaiMessages = withSystemMessage(openaiMessages, systemPrompt)
 
 	// Convert tools to OpenAI format
 	var openaiTools []openai.Tool
@@ -196,7 +200,7 @@ func (c *OpenAIClient) StreamChat(ctx context.Context, model string, messages []
 	debugLog("StreamChat: model=%s, temperature=%f, total_messages=%d", model, temperature, len(messages))
 	
 	// Convert messages to OpenAI format
-	openaiMessages := make([]openai.ChatCompletionMessage, 0)
+	openaiMessages := make([]openai.ChatCompletionMessage, 1, len(messages)+1)
 	systemPrompt := c.systemPrompt
 	
 	for _, msg := range messages {
@@ -219,14 +223,7 @@ func (c *OpenAIClient) StreamChat(ctx context.Context, model string, messages []
 		}
 	}
 	
-	// Add system message at the beginning if we have one
-	if systemPrompt != "" {
-		systemMsg := openai.ChatCompletionMessage{
-			Role:    "system",
-			Content: systemPrompt,
-		}
-		openaiMessages = append([]openai.ChatCompletionMessage{systemMsg}, openaiMessages...)
-	}
+	openaiMessages = withSystemMessage(openaiMessages, systemPrompt)
 
 	// Create streaming chat completion request
 	req := openai.ChatCompletionRequest{
@@ -301,3 +298,17 @@ func isOSeriesModel(model string) bool {
 	model = strings.ToLower(model)
 	return strings.HasPrefix(model, "o1") || strings.HasPrefix(model, "o3")
 }
+
+// withSystemMessage fills slot 0, which the message conversions reserve so
+// the system message never has to be prepended, or drops it if there is no
+// system prompt
+func withSystemMessage(msgs []openai.ChatCompletionMessage, systemPrompt string) []openai.ChatCompletionMessage {
+	if systemPrompt == "" {
+		return msgs[1:]
+	}
+	msgs[0] = openai.ChatCompletionMessage{
+		Role:    "system",
+		Content: systemPrompt,
+	}
+	return msgs
+}
@@ -1,6 +1,7 @@
 package providers
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -109,6 +110,20 @@ func (a *ChatAgent) Run(ctx context.Context) error {
 	fmt.Printf("Chat with %s (ctrl-C to quit)\n", a.client.Name())
 	fmt.Println("Tip: type 'show tools' to toggle tool result visibility.")
 
+	// Tools and the system prompt are fixed for the session, so convert and
+	// seed them once instead of rebuilding them on every turn
+	providerTools := make([]Tool, len(a.tools))
+	for i, t := range a.tools {
+		providerTools[i] = Tool{
+			Name:        t.Name,
+			Description: t.Description,
+			InputSchema: t.InputSchema,
+		}
+	}
+	messages := []ChatMessage{
+		{Role: RoleSystem, Content: a.systemPrompt},
+	}
+
 	// Use readUserInput flag to control conversation flow
 	readUserInput := true
 	for {
@@ -130,21 +145,8 @@ func (a *ChatAgent) Run(ctx context.Context) error {
 			a.conversation = append(a.conversation, ChatMessage{Role: RoleUser, Content: userInput})
 		}
 
-		// Convert tools to provider format
-		providerTools := make([]Tool, len(a.tools))
-		for i, t := range a.tools {
-			providerTools[i] = Tool{
-				Name:        t.Name,
-				Description: t.Description,
-				InputSchema: t.InputSchema,
-			}
-		}
-
-		// Build messages with system prompt
-		messages := []ChatMessage{
-			{Role: RoleSystem, Content: a.systemPrompt},
-		}
-		messages = append(messages, a.conversation...)
+		// Rebuild messages after the system prompt, reusing the buffer
+		messages = append(messages[:1], a.conversation...)
 
 		// Get response from the LLM
 		assistantMsgs, toolCalls, err := a.client.Chat(ctx, messages, providerTools)
@@ -239,15 +241,11 @@ func (a *ChatAgent) executeTool(toolID, toolName string, input json.RawMessage)
 
 // prettyJSON formats JSON for display
 func (a *ChatAgent) prettyJSON(content string) string {
-	var obj interface{}
-	if err := json.Unmarshal([]byte(content), &obj); err != nil {
+	// Indent re-formats the raw bytes in one pass without decoding into Go values
+	var pretty bytes.Buffer
+	if err := json.Indent(&pretty, []byte(content), "", "  "); err != nil {
 		return content // Return as-is if not JSON
 	}
 
-	pretty, err := json.MarshalIndent(obj, "", "  ")
-	if err != nil {
-		return content
-	}
-
-	return string(pretty)
+	return pretty.String()
 }
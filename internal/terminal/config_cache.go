@@ -0,0 +1,28 @@
+package terminal
+
+import (
+	"fmt"
+	"sync"
+
+	cfg "github.com/pprunty/magikarp/internal/config"
+)
+
+var (
+	sharedConfigOnce sync.Once
+	sharedConfig     *cfg.Config
+	sharedConfigErr  error
+)
+
+// loadSharedConfig loads the config.yaml found by findConfigFile once per
+// process and shares it between the welcome box and the model lists
+func loadSharedConfig() (*cfg.Config, error) {
+	sharedConfigOnce.Do(func() {
+		configPath := findConfigFile()
+		if configPath == "" {
+			sharedConfigErr = fmt.Errorf("config.yaml not found")
+			return
+		}
+		sharedConfig, sharedConfigErr = cfg.LoadConfig(configPath)
+	})
+	return sharedConfig, sharedConfigErr
+}
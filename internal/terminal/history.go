@@ -11,12 +11,18 @@ import (
 const (
 	maxHistorySize = 100
 	historyFile    = "input_history"
+
+	// The file is only appended to between compactions; LoadFromFile keeps the
+	// last maxHistorySize lines, so it may grow up to this many lines
+	maxHistoryFileLines = 2 * maxHistorySize
 )
 
 // HistoryManager handles persistent storage of input history
 type HistoryManager struct {
-	history []string
-	histDir string
+	history   []string
+	histDir   string
+	histFile  string
+	fileLines int // lines currently in the history file
 }
 
 // NewHistoryManager creates a new history manager
@@ -34,8 +40,9 @@ func NewHistoryManager() (*HistoryManager, error) {
 	}
 
 	hm := &HistoryManager{
-		history: make([]string, 0),
-		histDir: histDir,
+		history:  make([]string, 0),
+		histDir:  histDir,
+		histFile: filepath.Join(histDir, historyFile),
 	}
 
 	// Load existing history
@@ -55,10 +62,12 @@ func (hm *HistoryManager) AddMessage(message string) error {
 	}
 
 	// Remove duplicate if it exists
+	compact := false
 	for i, hist := range hm.history {
 		if hist == message {
 			// Remove the duplicate entry
 			hm.history = append(hm.history[:i], hm.history[i+1:]...)
+			compact = true
 			break
 		}
 	}
@@ -71,8 +80,12 @@ func (hm *HistoryManager) AddMessage(message string) error {
 		hm.history = hm.history[len(hm.history)-maxHistorySize:]
 	}
 
-	// Save to file
-	return hm.SaveToFile()
+	// Append to the file; rewrite it only when a duplicate has to be removed
+	// from it or it has grown past its bound
+	if compact || hm.fileLines >= maxHistoryFileLines {
+		return hm.SaveToFile()
+	}
+	return hm.appendToFile(message)
 }
 
 // GetHistory returns the full history slice
@@ -95,7 +108,7 @@ func (hm *HistoryManager) GetMessageAt(index int) string {
 
 // GetHistoryFile returns the path to the history file
 func (hm *HistoryManager) GetHistoryFile() string {
-	return filepath.Join(hm.histDir, historyFile)
+	return hm.histFile
 }
 
 // SaveToFile saves the current history to disk
@@ -111,6 +124,23 @@ func (hm *HistoryManager) SaveToFile() error {
 			return fmt.Errorf("failed to write to history file: %w", err)
 		}
 	}
+	hm.fileLines = len(hm.history)
+
+	return nil
+}
+
+// appendToFile appends a single message to the history file
+func (hm *HistoryManager) appendToFile(message string) error {
+	file, err := os.OpenFile(hm.GetHistoryFile(), os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0644)
+	if err != nil {
+		return fmt.Errorf("failed to open history file: %w", err)
+	}
+	defer file.Close()
+
+	if _, err := fmt.Fprintln(file, message); err != nil {
+		return fmt.Errorf("failed to write to history file: %w", err)
+	}
+	hm.fileLines++
 
 	return nil
 }
@@ -140,6 +170,7 @@ func (hm *HistoryManager) LoadFromFile() error {
 	if err := scanner.Err(); err != nil {
 		return fmt.Errorf("failed to read history file: %w", err)
 	}
+	hm.fileLines = len(hm.history)
 
 	// Ensure we don't exceed max size
 	if len(hm.history) > maxHistorySize {
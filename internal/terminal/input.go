@@ -1,11 +1,13 @@
 package terminal
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
 	"os"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/charmbracelet/bubbles/textinput"
@@ -85,7 +87,6 @@ func inputDebugLog(format string, args ...interface{}) {
 	if inputDebug && inputDebugFile != nil {
 		timestamp := time.Now().Format("2006/01/02 15:04:05")
 		fmt.Fprintf(inputDebugFile, "%s [Input] "+format+"\n", append([]interface{}{timestamp}, args...)...)
-		inputDebugFile.Sync()
 	}
 }
 
@@ -127,6 +128,9 @@ type InputModel struct {
 	triggerHelpScreen    bool           // Whether to trigger help screen
 	triggerModelSelect   bool           // Whether to trigger model selection screen
 	speechMode           bool           // Whether speech mode is enabled
+
+	// Rendered settled conversation pairs, shared across model copies
+	transcript *transcriptCache
 }
 
 // NewInputModel creates a new input model for the selected provider
@@ -161,6 +165,7 @@ func NewInputModel(provider string) InputModel {
 		triggerHelpScreen:    false,
 		triggerModelSelect:   false,
 		speechMode:           false, // Speech mode starts disabled
+		transcript:           &transcriptCache{},
 	}
 }
 
@@ -197,7 +202,11 @@ func spinnerTickCmd() tea.Cmd {
 func (m InputModel) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 	var cmd tea.Cmd
 
-	inputDebugLog("Update called with msg type: %T", msg)
+	// Update runs for every key press and spinner tick; skip building the
+	// log arguments unless debug logging is on
+	if inputDebug {
+		inputDebugLog("Update called with msg type: %T", msg)
+	}
 
 	switch msg := msg.(type) {
 	case aiResponseMsg:
@@ -244,7 +253,9 @@ func (m InputModel) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 		m.textInput.Width = max(18, m.width-6)
 	// Remove mouse scroll handling - let terminal handle it naturally
 	case tea.KeyMsg:
-		inputDebugLog("KeyMsg received: %s", msg.String())
+		if inputDebug {
+			inputDebugLog("KeyMsg received: %s", msg.String())
+		}
 		// Handle specific slash command navigation keys
 		if m.showingSlashCommands {
 			switch msg.String() {
@@ -455,6 +466,61 @@ func (m InputModel) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 	return m, cmd
 }
 
+// transcriptCache holds the rendered text of conversation pairs that can no
+// longer change, so View only re-renders the tail of the conversation
+type transcriptCache struct {
+	width    int
+	count    int
+	rendered strings.Builder
+}
+
+// renderConversation renders all conversation pairs. Pairs before the last one
+// are never modified again, so once settled they are rendered a single time
+// per terminal width and reused on every frame.
+func (m InputModel) renderConversation() string {
+	c := m.transcript
+	if c == nil {
+		c = &transcriptCache{}
+	}
+	if c.width != m.width || c.count > len(m.conversation) {
+		c.width = m.width
+		c.count = 0
+		c.rendered.Reset()
+	}
+
+	for c.count < len(m.conversation)-1 && !m.conversation[c.count].IsProcessing {
+		c.rendered.WriteString(m.renderPair(m.conversation[c.count]))
+		c.count++
+	}
+
+	var s strings.Builder
+	s.WriteString(c.rendered.String())
+	for _, pair := range m.conversation[c.count:] {
+		s.WriteString(m.renderPair(pair))
+	}
+	return s.String()
+}
+
+// renderPair renders a single user message and AI response exchange
+func (m InputModel) renderPair(pair ConversationPair) string {
+	// Wrap user message
+	userMsg := wrapText(pair.UserMessage, m.width-6) // Account for "> " prefix and margins
+	s := messageStyle.Render(fmt.Sprintf("> %s", userMsg)) + "\n"
+
+	if pair.AIResponse != "" {
+		// Wrap AI response
+		aiMsg := wrapText(pair.AIResponse, m.width-6) // Account for "⏺ " prefix and margins
+		s += aiResponseStyle.Render(fmt.Sprintf("⏺ %s", aiMsg)) + "\n"
+	} else if pair.IsProcessing {
+		if m.quitting {
+			s += aiResponseStyle.Render("Processing interrupted...") + "\n"
+		} else {
+			s += aiResponseStyle.Render(fmt.Sprintf("%s Processing...", spinnerChars[currentSpinnerIndex])) + "\n"
+		}
+	}
+	return s + "\n" // Blank line between exchanges
+}
+
 // ShouldTriggerHelp returns true if help screen should be triggered
 func (m InputModel) ShouldTriggerHelp() bool {
 	return m.triggerHelpScreen
@@ -502,7 +568,8 @@ func formatSlashCommand(command, description string) string {
 func stripANSI(s string) string {
 	// Simple regex to remove common ANSI escape sequences
 	// This is a basic implementation for length calculation
-	result := ""
+	var result strings.Builder
+	result.Grow(len(s))
 	inEscape := false
 	for _, r := range s {
 		if r == '\033' {
@@ -515,9 +582,9 @@ func stripANSI(s string) string {
 			}
 			continue
 		}
-		result += string(r)
+		result.WriteRune(r)
 	}
-	return result
+	return result.String()
 }
 
 // max returns the larger of two integers
@@ -591,25 +658,7 @@ func (m InputModel) View() string {
 
 	if m.quitting {
 		// Show conversation history on exit
-		s := "\n"
-		// Display all conversation pairs
-		if len(m.conversation) > 0 {
-			for _, pair := range m.conversation {
-				// Wrap user message
-				userMsg := wrapText(pair.UserMessage, m.width-6) // Account for "> " prefix and margins
-				s += messageStyle.Render(fmt.Sprintf("> %s", userMsg)) + "\n"
-
-				if pair.AIResponse != "" {
-					// Wrap AI response
-					aiMsg := wrapText(pair.AIResponse, m.width-6) // Account for "⏺ " prefix and margins
-					s += aiResponseStyle.Render(fmt.Sprintf("⏺ %s", aiMsg)) + "\n"
-				} else if pair.IsProcessing {
-					s += aiResponseStyle.Render("Processing interrupted...") + "\n"
-				}
-				s += "\n" // Blank line between exchanges
-			}
-		}
-		return s
+		return "\n" + m.renderConversation()
 	}
 
 	s := ""
@@ -617,21 +666,7 @@ func (m InputModel) View() string {
 	// Display conversation history (natural terminal flow)
 	if len(m.conversation) > 0 {
 		s += "\n"
-		// Display all conversation pairs
-		for _, pair := range m.conversation {
-			// Wrap user message
-			userMsg := wrapText(pair.UserMessage, m.width-6) // Account for "> " prefix and margins
-			s += messageStyle.Render(fmt.Sprintf("> %s", userMsg)) + "\n"
-
-			if pair.AIResponse != "" {
-				// Wrap AI response
-				aiMsg := wrapText(pair.AIResponse, m.width-6) // Account for "⏺ " prefix and margins
-				s += aiResponseStyle.Render(fmt.Sprintf("⏺ %s", aiMsg)) + "\n"
-			} else if pair.IsProcessing {
-				s += aiResponseStyle.Render(fmt.Sprintf("%s Processing...", spinnerChars[currentSpinnerIndex])) + "\n"
-			}
-			s += "\n" // Blank line between exchanges
-		}
+		s += m.renderConversation()
 	} else {
 		s += "\n"
 	}
@@ -639,13 +674,7 @@ func (m InputModel) View() string {
 	// Add border around text input with dynamic width
 	// Calculate exact width to prevent double borders
 	availableWidth := max(20, m.width-4) // Account for border chars and margins
-	borderStyle := lipgloss.NewStyle().
-		Border(lipgloss.RoundedBorder()).
-		BorderForeground(lipgloss.Color("8")).
-		Padding(0, 1).
-		Width(availableWidth)
-
-	inputWithBorder := borderStyle.Render(m.textInput.View())
+	inputWithBorder := inputBorderStyle.Width(availableWidth).Render(m.textInput.View())
 	s += inputWithBorder
 	s += "\n"
 
@@ -673,19 +702,15 @@ func (m InputModel) View() string {
 	// Show specific model name based on provider with speech mode indicator
 	modelName := GetModelDisplayName(m.provider)
 
-	speechIndicator := ""
+	speechIndicator := speechOffIndicator
 	if SpeechModeEnabled() {
-		speechIndicator = " " + speechModeOnStyle.Render("•") + " " + modelRunningStyle.Render("speech-to-text on")
-	} else {
-		speechIndicator = " " + speechModeOffStyle.Render("•") + " " + modelRunningStyle.Render("speech-to-text off")
+		speechIndicator = speechOnIndicator
 	}
 
 	// Tools indicator (reuse the same color styles)
-	toolsIndicator := ""
+	toolsIndicator := toolsOffIndicator
 	if GetToolsEnabled() {
-		toolsIndicator = " " + speechModeOnStyle.Render("•") + " " + modelRunningStyle.Render("tools on")
-	} else {
-		toolsIndicator = " " + speechModeOffStyle.Render("•") + " " + modelRunningStyle.Render("tools off")
+		toolsIndicator = toolsOnIndicator
 	}
 
 	s += modelRunningStyle.Render("• "+modelName) + speechIndicator + toolsIndicator
@@ -749,6 +774,12 @@ var (
 	slashCommandActiveStyle = lipgloss.NewStyle().
 				Foreground(lipgloss.Color("#9B59B6")) // Purple for active items
 
+	// Border around the text input; the width is applied per render
+	inputBorderStyle = lipgloss.NewStyle().
+				Border(lipgloss.RoundedBorder()).
+				BorderForeground(lipgloss.Color("8")).
+				Padding(0, 1)
+
 	// Speech mode indicator styles
 	speechModeOffStyle = lipgloss.NewStyle().
 				Foreground(lipgloss.Color("#FF0000")) // Red circle for speech mode off
@@ -769,8 +800,21 @@ func init() {
 		speechModeOnStyle = plain
 		speechModeOffStyle = plain
 	}
+
+	speechOnIndicator = " " + speechModeOnStyle.Render("•") + " " + modelRunningStyle.Render("speech-to-text on")
+	speechOffIndicator = " " + speechModeOffStyle.Render("•") + " " + modelRunningStyle.Render("speech-to-text off")
+	toolsOnIndicator = " " + speechModeOnStyle.Render("•") + " " + modelRunningStyle.Render("tools on")
+	toolsOffIndicator = " " + speechModeOffStyle.Render("•") + " " + modelRunningStyle.Render("tools off")
 }
 
+// Status line indicators, rendered once in init after the styles are final
+var (
+	speechOnIndicator  string
+	speechOffIndicator string
+	toolsOnIndicator   string
+	toolsOffIndicator  string
+)
+
 // processMessageAsync processes a user message with the AI provider asynchronously
 func processMessageAsync(userMessage, provider string) tea.Cmd {
 	return func() tea.Msg {
@@ -797,30 +841,8 @@ func processMessageAsync(userMessage, provider string) tea.Cmd {
 			{Role: providers.RoleUser, Content: userMessage},
 		}
 
-		// Get tools if enabled
-		var providerTools []providers.Tool
-		if GetToolsEnabled() {
-			allTools := tools.GetAllTools()
-			providerTools = make([]providers.Tool, len(allTools))
-			for i, tool := range allTools {
-				providerTools[i] = providers.Tool{
-					Name:        tool.Name,
-					Description: tool.Description,
-					InputSchema: tool.InputSchema,
-				}
-			}
-		} else {
-			// Always expose core tools even when general tools are disabled
-			core := tools.GetCoreTools()
-			providerTools = make([]providers.Tool, len(core))
-			for i, tool := range core {
-				providerTools[i] = providers.Tool{
-					Name:        tool.Name,
-					Description: tool.Description,
-					InputSchema: tool.InputSchema,
-				}
-			}
-		}
+		// Get tools if enabled; core tools are always exposed
+		providerTools := providerToolList(GetToolsEnabled())
 
 		// update global current model for query tools
 		SetCurrentModel(provider)
@@ -854,8 +876,10 @@ func processMessageAsync(userMessage, provider string) tea.Cmd {
 				// Build display name with parameters, truncate if too long
 				paramPreview := ""
 				if len(inputMap) > 0 {
-					if b, err := json.Marshal(inputMap); err == nil {
-						s := string(b)
+					// Compact the raw arguments rather than re-encoding the decoded map
+					var b bytes.Buffer
+					if err := json.Compact(&b, call.Input); err == nil {
+						s := b.String()
 						if len(s) > 60 {
 							s = s[:57] + "..."
 						}
@@ -927,6 +951,39 @@ func processMessageAsync(userMessage, provider string) tea.Cmd {
 	}
 }
 
+// The toolbox registry is fixed once package init has run, so the provider
+// tool lists are converted once and shared by every request.
+var (
+	providerToolsOnce sync.Once
+	allProviderTools  []providers.Tool
+	coreProviderTools []providers.Tool
+)
+
+// providerToolList returns all tools when enabled, otherwise only core tools
+func providerToolList(enabled bool) []providers.Tool {
+	providerToolsOnce.Do(func() {
+		allProviderTools = toProviderTools(tools.GetAllTools())
+		coreProviderTools = toProviderTools(tools.GetCoreTools())
+	})
+	if enabled {
+		return allProviderTools
+	}
+	return coreProviderTools
+}
+
+// toProviderTools converts tool definitions to the provider tool format
+func toProviderTools(defs []providers.ToolDefinition) []providers.Tool {
+	out := make([]providers.Tool, len(defs))
+	for i, tool := range defs {
+		out[i] = providers.Tool{
+			Name:        tool.Name,
+			Description: tool.Description,
+			InputSchema: tool.InputSchema,
+		}
+	}
+	return out
+}
+
 // Feature toggle: disable text beautification (colors/wrapping) when MAGIKARP_PLAIN=1
 var disableBeautify = os.Getenv("MAGIKARP_PLAIN") == "1"
 
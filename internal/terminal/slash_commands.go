@@ -1,12 +1,9 @@
 package terminal
 
 import (
-	"os"
 	"strings"
 
-	cfg "github.com/pprunty/magikarp/internal/config"
 	"github.com/pprunty/magikarp/internal/orchestration"
-	"gopkg.in/yaml.v3"
 )
 
 // SlashCommand represents a slash command with its name and description
@@ -15,15 +12,32 @@ type SlashCommand struct {
 	Description string
 }
 
-// GetAvailableCommands returns the list of available slash commands in alphabetical order
-func GetAvailableCommands() []SlashCommand {
-	return []SlashCommand{
-		{Name: "/exit", Description: "Exit Magikarp"},
-		{Name: "/help", Description: "Show help information"},
-		{Name: "/model", Description: "Switch between AI models"},
-		{Name: "/speech", Description: "Toggle speech mode on/off"},
-		{Name: "/tools", Description: "Toggle tools on/off"},
+// slashCommands lists the available slash commands in alphabetical order
+var slashCommands = []SlashCommand{
+	{Name: "/exit", Description: "Exit Magikarp"},
+	{Name: "/help", Description: "Show help information"},
+	{Name: "/model", Description: "Switch between AI models"},
+	{Name: "/speech", Description: "Toggle speech mode on/off"},
+	{Name: "/tools", Description: "Toggle tools on/off"},
+}
+
+// slashCommandKeys holds the lower-cased name (without "/") and description
+// of each slash command, matched against on every keystroke
+var slashCommandKeys = func() [][2]string {
+	keys := make([][2]string, len(slashCommands))
+	for i, cmd := range slashCommands {
+		keys[i] = [2]string{
+			strings.ToLower(strings.TrimPrefix(cmd.Name, "/")),
+			strings.ToLower(cmd.Description),
+		}
 	}
+	return keys
+}()
+
+// GetAvailableCommands returns the list of available slash commands in alphabetical order.
+// The returned slice is shared and must not be modified.
+func GetAvailableCommands() []SlashCommand {
+	return slashCommands
 }
 
 // ConfigYAML represents the structure of config.yaml for model loading
@@ -35,21 +49,8 @@ type ConfigYAML struct {
 
 // GetAvailableModels returns the list of available AI models from config.yaml
 func GetAvailableModels() []string {
-	// Load configuration once
-	configPath := findConfigFile()
-	var conf *cfg.Config
-	if path := configPath; path != "" {
-		data, err := os.ReadFile(path)
-		if err == nil {
-			if err2 := yaml.Unmarshal(data, &conf); err2 == nil {
-				// Expand env vars using existing helper
-				// but easier: load via cfg.LoadConfig which handles expansion
-			}
-		}
-	}
-
-	// Simpler – just load via cfg.LoadConfig API which already does env expansion/validation
-	c, err := cfg.LoadConfig(configPath)
+	// Load via cfg.LoadConfig which already does env expansion
+	c, err := loadSharedConfig()
 	if err != nil {
 		// fallback to default list
 		return []string{"claude-3-5-sonnet-20240620", "gpt-4o", "gemini-pro"}
@@ -70,8 +71,7 @@ func GetAvailableModels() []string {
 // GetAvailableModelsByProvider returns models grouped by provider
 func GetAvailableModelsByProvider() map[string][]string {
 	// Load configuration
-	configPath := findConfigFile()
-	c, err := cfg.LoadConfig(configPath)
+	c, err := loadSharedConfig()
 	if err != nil {
 		// fallback to default grouping
 		return map[string][]string{
@@ -96,13 +96,11 @@ func FilterCommands(input string) []SlashCommand {
 
 	// Remove the leading "/" for filtering
 	filterText := strings.ToLower(strings.TrimPrefix(input, "/"))
-	allCommands := GetAvailableCommands()
 	var filtered []SlashCommand
 
-	for _, cmd := range allCommands {
+	for i, cmd := range slashCommands {
 		// Check if command name (without /) contains the filter text
-		cmdName := strings.ToLower(strings.TrimPrefix(cmd.Name, "/"))
-		cmdDesc := strings.ToLower(cmd.Description)
+		cmdName, cmdDesc := slashCommandKeys[i][0], slashCommandKeys[i][1]
 
 		if strings.Contains(cmdName, filterText) || strings.Contains(cmdDesc, filterText) {
 			filtered = append(filtered, cmd)
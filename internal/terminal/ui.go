@@ -57,7 +57,6 @@ func uiDebugLog(format string, args ...interface{}) {
 	if uiDebug && uiDebugFile != nil {
 		timestamp := time.Now().Format("2006/01/02 15:04:05")
 		fmt.Fprintf(uiDebugFile, "%s [UI] "+format+"\n", append([]interface{}{timestamp}, args...)...)
-		uiDebugFile.Sync()
 	}
 }
 
@@ -3,6 +3,8 @@ package terminal
 import (
 	"os"
 	"path/filepath"
+	"sync"
+
 	"gopkg.in/yaml.v3"
 )
 
@@ -13,8 +15,22 @@ type Config struct {
 	// Other fields can be added as needed
 }
 
-// GetVersion returns the version from config.yaml
+var (
+	versionOnce   sync.Once
+	cachedVersion string
+)
+
+// GetVersion returns the version from config.yaml. The file is only read once
+// per process since views call this on every render.
 func GetVersion() string {
+	versionOnce.Do(func() {
+		cachedVersion = loadVersion()
+	})
+	return cachedVersion
+}
+
+// loadVersion reads the version field from config.yaml
+func loadVersion() string {
 	// Try to find config.yaml in current directory or parent directories
 	configPath := findConfigFile()
 	if configPath == "" {
@@ -39,45 +55,31 @@ func GetVersion() string {
 }
 
 // findConfigFile searches for config.yaml starting from current directory
+// and walking up the directory tree, stat'ing each candidate once
 func findConfigFile() string {
-	// Try current working directory first
 	wd, err := os.Getwd()
-	if err == nil {
-		configPath := filepath.Join(wd, "config.yaml")
-		if _, err := os.Stat(configPath); err == nil {
-			return configPath
+	if err != nil {
+		// Without a working directory fall back to relative lookups
+		for _, path := range []string{"config.yaml", "../config.yaml", "../../config.yaml"} {
+			if _, err := os.Stat(path); err == nil {
+				return path
+			}
 		}
+		return ""
 	}
 
-	// Try common locations
-	commonPaths := []string{
-		"config.yaml",
-		"./config.yaml",
-		"../config.yaml",
-		"../../config.yaml",
-	}
-
-	for _, path := range commonPaths {
-		if _, err := os.Stat(path); err == nil {
-			return path
+	for {
+		configPath := filepath.Join(wd, "config.yaml")
+		if _, err := os.Stat(configPath); err == nil {
+			return configPath
 		}
-	}
-
-	// Search up the directory tree as fallback
-	if wd != "" {
-		for {
-			configPath := filepath.Join(wd, "config.yaml")
-			if _, err := os.Stat(configPath); err == nil {
-				return configPath
-			}
 
-			parent := filepath.Dir(wd)
-			if parent == wd {
-				// Reached root directory
-				break
-			}
-			wd = parent
+		parent := filepath.Dir(wd)
+		if parent == wd {
+			// Reached root directory
+			break
 		}
+		wd = parent
 	}
 
 	return ""
@@ -5,7 +5,6 @@ import (
 	"strings"
 
 	"github.com/charmbracelet/lipgloss"
-	"github.com/pprunty/magikarp/internal/config"
 	"github.com/pprunty/magikarp/internal/orchestration"
 )
 
@@ -49,19 +48,24 @@ func renderWelcomeBox() string {
 	return style.Render(content)
 }
 
+// welcomeProvider describes a provider row in the welcome box
+type welcomeProvider struct {
+	name string // display name
+	key  string // provider key in config.yaml
+	env  string // API key environment variable
+}
+
+// welcomeProviders lists the providers shown in the welcome box
+var welcomeProviders = []welcomeProvider{
+	{"Anthropic", "anthropic", "ANTHROPIC_API_KEY"},
+	{"OpenAI", "openai", "OPENAI_API_KEY"},
+	{"Gemini", "gemini", "GEMINI_API_KEY"},
+	{"Mistral", "mistral", "MISTRAL_API_KEY"},
+	{"Alibaba", "alibaba", "ALIBABA_API_KEY"},
+}
+
 // getProviderStatus returns formatted provider status with grid layout
 func getProviderStatus() string {
-	providers := []struct {
-		name string
-		env  string
-	}{
-		{"Anthropic", "ANTHROPIC_API_KEY"},
-		{"OpenAI", "OPENAI_API_KEY"},
-		{"Gemini", "GEMINI_API_KEY"},
-		{"Mistral", "MISTRAL_API_KEY"},
-		{"Alibaba", "ALIBABA_API_KEY"},
-	}
-
 	// Get actual provider initialization status
 	providerInitStatus := getActualProviderStatus()
 
@@ -69,11 +73,11 @@ func getProviderStatus() string {
 	const colWidth = 20 // Width for each column
 
 	// Create grid layout (2 columns)
-	for i := 0; i < len(providers); i += 2 {
+	for i := 0; i < len(welcomeProviders); i += 2 {
 		line := "  "
 		
 		// First column
-		provider1 := providers[i]
+		provider1 := welcomeProviders[i]
 		name1 := grayTextStyle.Render(provider1.name + ":")
 		padding1 := colWidth - len(provider1.name) - 1
 		if padding1 < 1 {
@@ -81,7 +85,7 @@ func getProviderStatus() string {
 		}
 		
 		var indicator1 string
-		if isInitialized, exists := providerInitStatus[strings.ToLower(provider1.name)]; exists && isInitialized {
+		if isInitialized, exists := providerInitStatus[provider1.key]; exists && isInitialized {
 			indicator1 = setKeyStyle.Render("✓")
 		} else {
 			indicator1 = unsetKeyStyle.Render("✗")
@@ -90,8 +94,8 @@ func getProviderStatus() string {
 		line += name1 + strings.Repeat(" ", padding1) + indicator1
 		
 		// Second column (if exists)
-		if i+1 < len(providers) {
-			provider2 := providers[i+1]
+		if i+1 < len(welcomeProviders) {
+			provider2 := welcomeProviders[i+1]
 			name2 := grayTextStyle.Render(provider2.name + ":")
 			padding2 := colWidth - len(provider2.name) - 1
 			if padding2 < 1 {
@@ -99,7 +103,7 @@ func getProviderStatus() string {
 			}
 			
 			var indicator2 string
-			if isInitialized, exists := providerInitStatus[strings.ToLower(provider2.name)]; exists && isInitialized {
+			if isInitialized, exists := providerInitStatus[provider2.key]; exists && isInitialized {
 				indicator2 = setKeyStyle.Render("✓")
 			} else {
 				indicator2 = unsetKeyStyle.Render("✗")
@@ -117,14 +121,9 @@ func getProviderStatus() string {
 // getActualProviderStatus gets the real initialization status from the registry
 func getActualProviderStatus() map[string]bool {
 	// Try to load config and get provider status
-	configPath := findConfigFile()
-	if configPath == "" {
-		return make(map[string]bool) // Return empty if no config
-	}
-	
-	cfg, err := config.LoadConfig(configPath)
+	cfg, err := loadSharedConfig()
 	if err != nil {
-		return make(map[string]bool) // Return empty if config load fails
+		return make(map[string]bool) // Return empty if no config or load fails
 	}
 	
 	// Initialize the registry (this is safe to call multiple times)
@@ -137,7 +136,8 @@ func getActualProviderStatus() map[string]bool {
 // stripANSIForWidth removes ANSI escape sequences for length calculations
 func stripANSIForWidth(str string) string {
 	// Simple implementation - in production you might want a more robust solution
-	result := ""
+	var result strings.Builder
+	result.Grow(len(str))
 	inEscape := false
 	for _, r := range str {
 		if r == '\033' {
@@ -150,9 +150,9 @@ func stripANSIForWidth(str string) string {
 			}
 			continue
 		}
-		result += string(r)
+		result.WriteRune(r)
 	}
-	return result
+	return result.String()
 }
 
 // renderWelcomeBoxWithVersion creates welcome box with version display below
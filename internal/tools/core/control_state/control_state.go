@@ -38,9 +38,13 @@ func Definition() providers.ToolDefinition {
 }
 
 func run(ctx context.Context, data map[string]interface{}) (*providers.ToolResult, error) {
-	raw, _ := json.Marshal(data)
+	// Read the parameters straight from the decoded input map
 	var in input
-	if err := json.Unmarshal(raw, &in); err != nil {
+	var err error
+	if in.Action, err = tools.StringParam(data, "action"); err != nil {
+		return providers.NewToolResult("control_state", fmt.Sprintf("invalid input: %v", err), true), nil
+	}
+	if in.Value, err = tools.StringParam(data, "value"); err != nil {
 		return providers.NewToolResult("control_state", fmt.Sprintf("invalid input: %v", err), true), nil
 	}
 
@@ -5,6 +5,7 @@ import (
 	_ "embed"
 	"encoding/json"
 	"fmt"
+	"strings"
 
 	"github.com/pprunty/magikarp/internal/providers"
 	"github.com/pprunty/magikarp/internal/tools"
@@ -30,12 +31,12 @@ func Definition() providers.ToolDefinition {
 // run returns a list of all registered tools.
 func run(ctx context.Context, _ map[string]interface{}) (*providers.ToolResult, error) {
 	all := tools.GetAllTools()
-	var out string
-	for _, t := range all {
-		out += fmt.Sprintf("- %s: %s\n", t.Name, t.Description)
+	if len(all) == 0 {
+		return providers.NewToolResult("list_tools", "No tools registered", false), nil
 	}
-	if out == "" {
-		out = "No tools registered"
+	var out strings.Builder
+	for _, t := range all {
+		fmt.Fprintf(&out, "- %s: %s\n", t.Name, t.Description)
 	}
-	return providers.NewToolResult("list_tools", out, false), nil
+	return providers.NewToolResult("list_tools", out.String(), false), nil
 }
@@ -10,6 +10,7 @@ import (
 	"time"
 
 	"github.com/pprunty/magikarp/internal/providers"
+	"github.com/pprunty/magikarp/internal/tools"
 )
 
 //go:embed tool.json
@@ -60,16 +61,27 @@ var dangerousCommands = []string{
 	"|", "||", "&&", ";", "$(", "`", // Command chaining
 }
 
+// parseInput reads the tool parameters from the decoded input map
+func parseInput(data map[string]interface{}) (input, error) {
+	var in input
+	var err error
+	if in.Script, err = tools.StringParam(data, "script"); err != nil {
+		return in, err
+	}
+	if in.Timeout, err = tools.IntParam(data, "timeout"); err != nil {
+		return in, err
+	}
+	if in.WorkDir, err = tools.StringParam(data, "work_dir"); err != nil {
+		return in, err
+	}
+	return in, nil
+}
+
 // run executes the command and returns the result
 func run(ctx context.Context, inputData map[string]interface{}) (*providers.ToolResult, error) {
 	// Convert generic input data to our structured input type
-	raw, err := json.Marshal(inputData)
+	in, err := parseInput(inputData)
 	if err != nil {
-		return providers.NewToolResult("bash", fmt.Sprintf("Error processing input parameters: %v", err), true), nil
-	}
-
-	var in input
-	if err := json.Unmarshal(raw, &in); err != nil {
 		return providers.NewToolResult("bash", fmt.Sprintf("Error parsing input parameters: %v", err), true), nil
 	}
 
@@ -1,18 +1,21 @@
 package read_file
 
 import (
+	"bytes"
 	"context"
 	"crypto/sha256"
 	_ "embed"
 	"encoding/base64"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"strings"
 	"unicode/utf8"
 
 	"github.com/pprunty/magikarp/internal/providers"
+	"github.com/pprunty/magikarp/internal/tools"
 )
 
 //go:embed tool.json
@@ -47,13 +50,8 @@ func Definition() providers.ToolDefinition {
 
 func run(ctx context.Context, inMap map[string]any) (*providers.ToolResult, error) {
 	// Parse input parameters
-	var in input
-	inputBytes, err := json.Marshal(inMap)
+	in, err := parseInput(inMap)
 	if err != nil {
-		return providers.NewToolResult("read_file", fmt.Sprintf("Error processing input parameters: %v", err), true), nil
-	}
-
-	if err := json.Unmarshal(inputBytes, &in); err != nil {
 		return providers.NewToolResult("read_file", fmt.Sprintf("Error parsing input parameters: %v", err), true), nil
 	}
 
@@ -76,7 +74,8 @@ func run(ctx context.Context, inMap map[string]any) (*providers.ToolResult, erro
 	// Clean path and handle case-insensitive search if needed
 	path := filepath.Clean(in.Path)
 
-	if _, err := os.Stat(path); os.IsNotExist(err) {
+	fileInfo, err := os.Stat(path)
+	if os.IsNotExist(err) {
 		// Try case-insensitive match
 		dir := filepath.Dir(path)
 		base := filepath.Base(path)
@@ -89,24 +88,32 @@ func run(ctx context.Context, inMap map[string]any) (*providers.ToolResult, erro
 		}
 
 		// Look for case-insensitive match
-		found := false
+		var match os.DirEntry
 		for _, e := range entries {
 			if strings.EqualFold(e.Name(), base) {
-				path = filepath.Join(dir, e.Name())
-				found = true
+				match = e
 				break
 			}
 		}
 
-		if !found {
+		if match == nil {
 			return providers.NewToolResult("read_file",
 				fmt.Sprintf("File not found: %s (no case-insensitive match found)", in.Path), true), nil
 		}
-	}
 
-	// Check if path exists and is a file
-	fileInfo, err := os.Stat(path)
-	if err != nil {
+		path = filepath.Join(dir, match.Name())
+
+		// Reuse the directory entry's metadata unless it is a symlink, in
+		// which case the target has to be stat'ed
+		if match.Type()&os.ModeSymlink != 0 {
+			fileInfo, err = os.Stat(path)
+		} else {
+			fileInfo, err = match.Info()
+		}
+		if err != nil {
+			return providers.NewToolResult("read_file", fmt.Sprintf("Error accessing file: %v", err), true), nil
+		}
+	} else if err != nil {
 		return providers.NewToolResult("read_file", fmt.Sprintf("Error accessing file: %v", err), true), nil
 	}
 
@@ -121,11 +128,27 @@ func run(ctx context.Context, inMap map[string]any) (*providers.ToolResult, erro
 				fileInfo.Size(), in.MaxSize), true), nil
 	}
 
-	// Read file content
-	data, err := os.ReadFile(path)
+	// Read file content. The stat size is only a hint (files under /proc
+	// report 0, and the file may change after the check), so read at most
+	// one byte past the limit and enforce the limit on what was read.
+	file, err := os.Open(path)
 	if err != nil {
 		return providers.NewToolResult("read_file", fmt.Sprintf("Error reading file: %v", err), true), nil
 	}
+	defer file.Close()
+
+	// Pre-size the buffer from the stat; ReadFrom wants MinRead bytes free
+	// before each read, including the final one that sees EOF
+	var buf bytes.Buffer
+	buf.Grow(int(fileInfo.Size()) + bytes.MinRead)
+	if _, err := buf.ReadFrom(io.LimitReader(file, int64(in.MaxSize)+1)); err != nil {
+		return providers.NewToolResult("read_file", fmt.Sprintf("Error reading file: %v", err), true), nil
+	}
+	data := buf.Bytes()
+	if len(data) > in.MaxSize {
+		return providers.NewToolResult("read_file",
+			fmt.Sprintf("File size exceeds maximum allowed size (%d bytes)", in.MaxSize), true), nil
+	}
 
 	// Validate UTF-8 encoding
 	if !utf8.Valid(data) && !in.DetectEncoding {
@@ -150,7 +173,7 @@ func run(ctx context.Context, inMap map[string]any) (*providers.ToolResult, erro
 		stats := map[string]interface{}{
 			"content":      content,
 			"path":         path,
-			"size_bytes":   fileInfo.Size(),
+			"size_bytes":   len(data),
 			"lines":        lineCount,
 			"modified_at":  fileInfo.ModTime(),
 			"content_hash": contentHash,
@@ -170,6 +193,26 @@ func run(ctx context.Context, inMap map[string]any) (*providers.ToolResult, erro
 }
 
 /* helpers */
+
+// parseInput reads the tool parameters from the decoded input map
+func parseInput(m map[string]any) (input, error) {
+	var in input
+	var err error
+	if in.Path, err = tools.StringParam(m, "path"); err != nil {
+		return in, err
+	}
+	if in.MaxSize, err = tools.IntParam(m, "max_size"); err != nil {
+		return in, err
+	}
+	if in.DetectEncoding, err = tools.BoolParam(m, "detect_encoding"); err != nil {
+		return in, err
+	}
+	if in.IncludeStats, err = tools.BoolParam(m, "include_stats"); err != nil {
+		return in, err
+	}
+	return in, nil
+}
+
 func contains(raw any, key string) bool {
 	if arr, ok := raw.([]any); ok {
 		for _, v := range arr {
@@ -0,0 +1,52 @@
+package tools
+
+import (
+	"fmt"
+	"math"
+)
+
+// Helpers for reading tool parameters from the decoded input map. A missing
+// parameter yields the zero value; a parameter of the wrong type is an error.
+
+// StringParam returns the string parameter named key.
+func StringParam(m map[string]any, key string) (string, error) {
+	switch v := m[key].(type) {
+	case nil:
+		return "", nil
+	case string:
+		return v, nil
+	default:
+		return "", fmt.Errorf("%s must be a string", key)
+	}
+}
+
+// IntParam returns the integer parameter named key. JSON numbers decode as
+// float64, so values with a fractional part or outside the int range are
+// rejected rather than truncated or wrapped.
+func IntParam(m map[string]any, key string) (int, error) {
+	switch v := m[key].(type) {
+	case nil:
+		return 0, nil
+	case int:
+		return v, nil
+	case float64:
+		if v != math.Trunc(v) || v < math.MinInt || v >= -math.MinInt {
+			return 0, fmt.Errorf("%s must be an integer", key)
+		}
+		return int(v), nil
+	default:
+		return 0, fmt.Errorf("%s must be an integer", key)
+	}
+}
+
+// BoolParam returns the boolean parameter named key.
+func BoolParam(m map[string]any, key string) (bool, error) {
+	switch v := m[key].(type) {
+	case nil:
+		return false, nil
+	case bool:
+		return v, nil
+	default:
+		return false, fmt.Errorf("%s must be a boolean", key)
+	}
+}
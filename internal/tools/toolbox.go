@@ -31,10 +31,23 @@ func (b *BaseToolbox) Description() string                { return b.description
 func (b *BaseToolbox) Tools() []providers.ToolDefinition  { return b.tools }
 func (b *BaseToolbox) AddTool(t providers.ToolDefinition) { b.tools = append(b.tools, t) }
 
-var registry []Toolbox
+var (
+	registry []Toolbox
+	byName   = map[string]providers.ToolDefinition{}
+)
 
-// Register adds a toolbox to the global registry.
-func Register(tb Toolbox) { registry = append(registry, tb) }
+// Register adds a toolbox to the global registry and indexes its tools by
+// name. Toolboxes add their tools before registering, so the index is
+// complete once init has run.
+func Register(tb Toolbox) {
+	registry = append(registry, tb)
+	for _, t := range tb.Tools() {
+		// keep the first registration, matching registry order
+		if _, exists := byName[t.Name]; !exists {
+			byName[t.Name] = t
+		}
+	}
+}
 
 // GetAllTools returns every tool definition registered across all toolboxes.
 func GetAllTools() []providers.ToolDefinition {
@@ -58,14 +71,8 @@ func GetCoreTools() []providers.ToolDefinition {
 
 // GetToolByName finds a tool by name.
 func GetToolByName(name string) (providers.ToolDefinition, bool) {
-	for _, tb := range registry {
-		for _, t := range tb.Tools() {
-			if t.Name == name {
-				return t, true
-			}
-		}
-	}
-	return providers.ToolDefinition{}, false
+	t, ok := byName[name]
+	return t, ok
 }
 
 // Toolboxes lists registered toolboxes.